@@ -1,16 +1,15 @@
 # Copyright (c) 2024 Brad Kartchner
 # Released under the terms of the LGPLv3 or higher.
 
-import collections
+from contextlib import contextmanager
 import datetime
 from functools import cached_property
-from glob import glob
 import json
 import os.path
 import re
 from typing import Dict, TYPE_CHECKING, List
 
-from PyQt6.QtCore import QObject, pyqtProperty, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QTimer, pyqtProperty, pyqtSignal, pyqtSlot
 PYQT_VERSION = 6
 
 from UM.Application import Application
@@ -19,10 +18,11 @@ from UM.Logger import Logger
 from UM.Message import Message
 from UM.PluginRegistry import PluginRegistry
 from UM.Resources import Resources
-from UM.Settings.SettingInstance import SettingInstance #For typing.
-from UM.i18n import i18nCatalog
 from cura.CuraApplication import CuraApplication
 
+if TYPE_CHECKING:
+    from UM.Settings.SettingInstance import SettingInstance
+
 
 
 class PostProcessingGui(QObject, Extension):
@@ -40,14 +40,36 @@ class PostProcessingGui(QObject, Extension):
         # this plugin
         self._script_table:List[Dict] = []
 
+        # Indexes the supported script information by script key
+        self._script_table_by_key:Dict[str, List[Dict]] = {}
+
+        # Maps each script key to the index of its first entry in the table
+        self._script_index_by_key:Dict[str, int] = {}
+
+        # The model of available scripts only changes with the script table
+        self._available_scripts_model:List[Dict[str, str]] = []
+
         # Keeps track of the currently-selected post-processing script
         self._selected_script_index:int = 0
 
+        # Caches the key of each post-processing script class, since looking
+        # it up requires parsing the script's setting data
+        self._script_key_by_class:Dict[type, str] = {}
+
+        # Caches the active scripts model until the active scripts change
+        self._active_scripts_model:List[Dict]|None = None
+
+        # Set when an update of the active scripts model has been scheduled
+        self._active_scripts_model_dirty:bool = False
+
         # Holds the post-processing script that is waiting to be added
         self._tempScript = None
 
         # Keeps track of the global container stack
         self._global_container_stack = None        
+
+        # Set once the plugin has connected to the application's signals
+        self._initialized:bool = False
         
         # Make scripts installed with this plugin visible to the post-processing plugin
         Resources.addSearchPath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resources"))
@@ -92,11 +114,23 @@ class PostProcessingGui(QObject, Extension):
     
 
 
+    @cached_property
+    def _jsonDir(self)->str:
+        ''' Convenience property to cache and return the directory of JSON
+            files '''
+
+        json_dir = os.path.join(self._pluginDir, 'Resources', 'Json')
+        return json_dir
+
+
+
     @cached_property
     def _activeScriptsPanel(self)->QObject:
-        ''' Convenience property to cache and return the active scripts panel '''
+        ''' Convenience property to cache and return the active scripts panel
+            Only a lightweight loader is created here; the panel itself is
+            loaded by QML the first time it is shown '''
 
-        qml_file_path = os.path.join(self._qmlDir, 'ActiveScriptsPanel.qml')
+        qml_file_path = os.path.join(self._qmlDir, 'ActiveScriptsPanelLoader.qml')
         component = CuraApplication.getInstance().createQmlComponent(qml_file_path, {'manager': self})
         return component
     
@@ -112,9 +146,19 @@ class PostProcessingGui(QObject, Extension):
 
 
 
-    @property
+    @cached_property
+    def _simulationView(self):
+        ''' Convenience property to cache and return the SimulationView '''
+
+        simulation_view = Application.getInstance().getController().getView('SimulationView')
+        return simulation_view
+
+
+
+    @cached_property
     def _postProcessingPlugin(self):
-        ''' Convenience property to return the PostProcessingPlugin object '''
+        ''' Convenience property to cache and return the PostProcessingPlugin
+            object '''
 
         plugin = PluginRegistry.getInstance().getPluginObject('PostProcessingPlugin')
         return plugin
@@ -152,11 +196,10 @@ class PostProcessingGui(QObject, Extension):
     @pyqtProperty(list, notify=_available_scripts_model_changed)
     def availableScriptsModel(self)->list[dict[str, str]]:
         ''' Return a model containing the names of all active scripts supported
-            by this plugin '''
+            by this plugin
+            The model is built along with the script table '''
 
-        model = [{'script_name': script_data['script_name']} for script_data in self._script_table]
-        
-        return model
+        return self._available_scripts_model
 
 
 
@@ -182,7 +225,7 @@ class PostProcessingGui(QObject, Extension):
 
         # Set the layer number in the script
         layer_number_setting = script_data['layer_number_setting']   
-        layer_number = Application.getInstance().getController().getView('SimulationView').getCurrentLayer() + 1
+        layer_number = self._simulationView.getCurrentLayer() + 1
         self._tempScript._stack.getTop().setProperty(layer_number_setting, 'value', layer_number)
             
         # Broadcast that the selected script has been changed
@@ -203,11 +246,10 @@ class PostProcessingGui(QObject, Extension):
         ''' Return the ID of DefinitionContainer for the currently-selected 
             script '''
         
-        try:
-            id = self._tempScript.getDefinitionId()
-        except AttributeError:
-            id = ''
-        return id
+        # There is no definition until a script has been selected
+        if self._tempScript is None:
+            return ''
+        return self._tempScript.getDefinitionId()
 
 
 
@@ -217,79 +259,80 @@ class PostProcessingGui(QObject, Extension):
             This is a unique numerical ID based on the script object instance 
             and is set by the Script class '''
 
-        try:
-            id = self._tempScript.getStackId()
-        except AttributeError:
-            id = ''
-        return id
+        # There is no stack until a script has been selected
+        if self._tempScript is None:
+            return ''
+        return self._tempScript.getStackId()
 
 
 
     @pyqtProperty(list, notify=_active_scripts_model_changed)
     def activeScriptsModel(self)->list:
         ''' Return a list of dictionaries describing the name and layer number
-            for each active script supported by this plugin '''
+            for each active script supported by this plugin
+            The model is cached and only rebuilt after the active scripts have
+            changed '''
+
+        # Reuse the cached model if the active scripts haven't changed
+        if self._active_scripts_model is not None:
+            return self._active_scripts_model
 
         active_scripts_model = []
 
         # Iterate over each active post-processing script
-        for index in range(0, len(self._postProcessingPlugin._script_list)):
+        for index, script in enumerate(self._postProcessingPlugin._script_list):
 
-            # Retrieve the postprocessing script
-            script = self._postProcessingPlugin._script_list[index]
-            script_key = script.getSettingData()['key']
+            # Retrieve the postprocessing script key
+            script_key = self._getScriptKey(script)
 
-            # Iterate over each supported script
-            for script_data in self._script_table:
+            # Iterate over each supported script with a matching key
+            for script_data in self._script_table_by_key.get(script_key, []):
 
-                # Process this post-processing script if it's supported
-                if script_data['script_key'] == script_key:
-                    
-                    try:
-                        # Iterate over the critical settings for the script
-                        critical_settings_match = True
-                        critical_settings_dict = script_data['critical_settings']
-                        for critical_setting_key, critical_setting_value in critical_settings_dict.items():
-
-                            # Check for missing or mismatched critical settings
-                            try:
-                                setting_value = script.getSettingValueByKey(critical_setting_key)
-                                if setting_value != critical_setting_value:
-                                    critical_settings_match = False
-                                    break
-
-                            except KeyError as e:
+                try:
+                    # Iterate over the critical settings for the script
+                    critical_settings_match = True
+                    critical_settings_dict = script_data['critical_settings']
+                    for critical_setting_key, critical_setting_value in critical_settings_dict.items():
+
+                        # Check for missing or mismatched critical settings
+                        try:
+                            setting_value = script.getSettingValueByKey(critical_setting_key)
+                            if setting_value != critical_setting_value:
                                 critical_settings_match = False
                                 break
 
-                        # If there is a critical setting mismatch, ignore this 
-                        # script
-                        if critical_settings_match == False:
-                            continue
-
-                    except KeyError:
-                        # No critical_settings for this script?  Fine
-                        pass
+                        except KeyError as e:
+                            critical_settings_match = False
+                            break
 
-                    # Look up the layer number setting in the script
-                    layer_number_setting = script_data['layer_number_setting']
-                    try:
-                        layer_number = int(script.getSettingValueByKey(layer_number_setting))
-                    except ValueError:
-                        # If the layer number cannot be interpreted as an 
-                        # integer, then the script can't be used
+                    # If there is a critical setting mismatch, ignore this 
+                    # script
+                    if critical_settings_match == False:
                         continue
 
-                    # Retrieve the script name, key, and stackId
-                    script_name = script_data['script_name']
-                    script_key = script_data['script_key']
+                except KeyError:
+                    # No critical_settings for this script?  Fine
+                    pass
+
+                # Look up the layer number setting in the script
+                layer_number_setting = script_data['layer_number_setting']
+                try:
+                    layer_number = int(script.getSettingValueByKey(layer_number_setting))
+                except ValueError:
+                    # If the layer number cannot be interpreted as an 
+                    # integer, then the script can't be used
+                    continue
+
+                # Retrieve the script name, key, and stackId
+                script_name = script_data['script_name']
+                script_key = script_data['script_key']
 
-                    # Add the script information to the  model
-                    active_scripts_model.append({'script_key': script_key, 'script_name': script_name, 'layer_number': layer_number, 'script_index': index})
+                # Add the script information to the  model
+                active_scripts_model.append({'script_key': script_key, 'script_name': script_name, 'layer_number': layer_number, 'script_index': index})
 
         # Sort the scripts by ascending layer number
-        active_scripts_model = sorted(active_scripts_model, key=lambda x: x['layer_number'])
-        return active_scripts_model
+        self._active_scripts_model = sorted(active_scripts_model, key=lambda x: x['layer_number'])
+        return self._active_scripts_model
 
 
 
@@ -322,7 +365,7 @@ class PostProcessingGui(QObject, Extension):
         # Update the layer number in the selected script
         script_data = self._script_table[self._selected_script_index]
         layer_number_setting = script_data['layer_number_setting'] 
-        layer_number = Application.getInstance().getController().getView('SimulationView').getCurrentLayer() + 1
+        layer_number = self._simulationView.getCurrentLayer() + 1
         self._tempScript._stack.getTop().setProperty(layer_number_setting, 'value', layer_number)
 
         # Display the add script menu
@@ -345,16 +388,16 @@ class PostProcessingGui(QObject, Extension):
 
         # Subtract one from the layer due to the way Cura numbers its layers in 
         # the GUI
-        Application.getInstance().getController().getView('SimulationView').setLayer(layer_number - 1)
+        self._simulationView.setLayer(layer_number - 1)
 
 
 
-    @pyqtSlot(int)
-    def onActiveScriptButtonCenterClicked(self, script_index:int)->None:
+    @pyqtSlot(int, str, int)
+    def onActiveScriptButtonCenterClicked(self, script_index:int, script_key:str, layer_number:int)->None:
         ''' When an active script button is center-clicked, the script for that
             button is removed from the list of post-processing scripts '''
 
-        self._removeScript(script_index)
+        self._removeScript(script_index, script_key, layer_number)
 
 
 
@@ -378,25 +421,43 @@ class PostProcessingGui(QObject, Extension):
             script_data = self._script_table[self._selected_script_index]
             selected_script_key = script_data['script_key']
 
-            # Don't bother the post-processing plugin with this write
-            self._postProcessingPlugin._global_container_stack.metaDataChanged.disconnect(self._postProcessingPlugin._restoreScriptInforFromMetadata)
-
-            # Initialize the plugin's metadata entry if it's not already present
-            if self._metaDataId not in self._global_container_stack.getMetaData():
-                self._global_container_stack.setMetaDataEntry(self._metaDataId, '')
-
-            # Save the selected script key
-            # TODO: Should probably save a serialized dict of settings for future expandibility
-            self._global_container_stack.setMetaDataEntry(self._metaDataId, selected_script_key)
+            # There's nothing to do if the saved script key hasn't changed
+            # (this is called every time the add script menu is closed)
+            if self._global_container_stack.getMetaDataEntry(self._metaDataId) == selected_script_key:
+                return
 
             # Don't bother the post-processing plugin with this write
-            self._postProcessingPlugin._global_container_stack.metaDataChanged.connect(self._postProcessingPlugin._restoreScriptInforFromMetadata)
+            with self._postProcessingMetaDataChangedSuppressed():
+
+                # Save the selected script key
+                # TODO: Should probably save a serialized dict of settings for future expandibility
+                self._global_container_stack.setMetaDataEntry(self._metaDataId, selected_script_key)
 
         else:
             Logger.log('e', 'Unable to save plugin settings without a global container stack')
 
 
 
+    @contextmanager
+    def _postProcessingMetaDataChangedSuppressed(self):
+        ''' Context manager that keeps the post-processing plugin from reacting
+            to metadata changes made within it
+            The plugin is disconnected once on entry and reconnected on exit,
+            even if an exception occurs, so any number of metadata entries can
+            be written in between '''
+
+        meta_data_changed = self._postProcessingPlugin._global_container_stack.metaDataChanged
+        restore_slot = self._postProcessingPlugin._restoreScriptInforFromMetadata
+
+        meta_data_changed.disconnect(restore_slot)
+        try:
+            yield
+        finally:
+            meta_data_changed.connect(restore_slot)
+
+
+
+    @pyqtSlot()
     def _onActivityChanged(self)->None:
         ''' Called when the sliced state of the SimulationView has changed or 
             the view has changed
@@ -416,25 +477,36 @@ class PostProcessingGui(QObject, Extension):
         # Disconnect from the previous global container stack
         try:
             self._global_container_stack.propertyChanged.disconnect(self._onGlobalContainerStackPropertyChanged)
-        except TypeError as e:
+        except (TypeError, AttributeError) as e:
             Logger.log('e', f'Error disconnecting from old Global Container Stack: {e}')
 
         # Remember the new global container stack and listen for it to change
         self._global_container_stack = Application.getInstance().getGlobalContainerStack()
         try:
             self._global_container_stack.propertyChanged.connect(self._onGlobalContainerStackPropertyChanged)
-        except TypeError as e:
+        except (TypeError, AttributeError) as e:
             Logger.log('e', f'Error connecting to old Global Container Stack: {e}')
 
+        # Setting changes on the new stack weren't being watched, so the cached
+        # active scripts model can't be trusted
+        self._invalidateActiveScriptsModel()
+
         # Restore or initialize the available scripts based on the new global container stack
         self._loadPluginSettings()
 
 
 
+    @pyqtSlot()
     def _onMainWindowChanged(self)->None:
         ''' The application should be ready at this point so most plugin 
             initialization is done here '''
 
+        # Don't connect to everything a second time if this is somehow called
+        # again, since duplicate connections would duplicate all the work
+        if self._initialized:
+            return
+        self._initialized = True
+
         # We won't be needing this callback anymore 
         # (it's probably not necessary to disconnect, but I'm doing it anyway)
         CuraApplication.getInstance().mainWindowChanged.disconnect(self._onMainWindowChanged)
@@ -448,11 +520,14 @@ class PostProcessingGui(QObject, Extension):
         except TypeError as e:
             Logger.log('e', f'Error connecting to the Global Container Stack: {e}')
 
+        # Follow the global container stack when the printer is changed
+        Application.getInstance().globalContainerStackChanged.connect(self._onGlobalContainerStackChanged)
+
         # Initialize the scripts
         self._initializeScriptTable()
 
         # Monitor for changes to the simulation view and active view
-        Application.getInstance().getController().getView('SimulationView').activityChanged.connect(self._onActivityChanged)
+        self._simulationView.activityChanged.connect(self._onActivityChanged)
         CuraApplication.getInstance().getController().activeViewChanged.connect(self._onActivityChanged)
 
         # Create the active scripts panel
@@ -464,26 +539,72 @@ class PostProcessingGui(QObject, Extension):
         # Listen for post-processing script changes
         self._postProcessingPlugin.scriptListChanged.connect(self._onPostProcessingScriptListChanged)
 
+        # Listen for the post-processing plugin to (re)load its scripts
+        self._postProcessingPlugin.loadedScriptListChanged.connect(self._onPostProcessingLoadedScriptListChanged)
+
         # Load persistant plugin settings
         self._loadPluginSettings()
 
 
 
-    def _onGlobalContainerStackPropertyChanged(self, instance:SettingInstance, property:str)->None:
+    def _onGlobalContainerStackPropertyChanged(self, instance:'SettingInstance', property:str)->None:
         ''' Called whenever a property is changed in the global container stack '''
         
         # Only react to value changes
         if property == 'value':
             
             # Update the active scripts panel
-            self._active_scripts_model_changed.emit()
+            self._invalidateActiveScriptsModel()
 
 
 
+    @pyqtSlot()
     def _onPostProcessingScriptListChanged(self)->None:
         ''' Called whenever the active post-processing scripts change '''
 
         # Update the active scripts
+        self._invalidateActiveScriptsModel()
+
+
+
+    @pyqtSlot()
+    def _onPostProcessingLoadedScriptListChanged(self)->None:
+        ''' Called whenever the post-processing plugin loads its scripts
+            The script table refers to the loaded script classes, so it and
+            everything derived from it is rebuilt '''
+
+        # Rebuild the table of supported scripts
+        self._initializeScriptTable()
+
+        # Active scripts may now match different entries in the table
+        self._invalidateActiveScriptsModel()
+
+        # Restore the selected script, which also recreates the temporary
+        # script if its class was reloaded
+        self._loadPluginSettings()
+
+
+
+    def _invalidateActiveScriptsModel(self)->None:
+        ''' Discard the cached active scripts model and schedule the GUI to be
+            updated
+            Changes often arrive in bursts (a profile change touches many
+            settings), so they are coalesced into a single update once control
+            returns to the event loop '''
+
+        self._active_scripts_model = None
+
+        if not self._active_scripts_model_dirty:
+            self._active_scripts_model_dirty = True
+            QTimer.singleShot(0, self._flushActiveScriptsModelChanged)
+
+
+
+    @pyqtSlot()
+    def _flushActiveScriptsModelChanged(self)->None:
+        ''' Broadcast a single change for any pending active script updates '''
+
+        self._active_scripts_model_dirty = False
         self._active_scripts_model_changed.emit()
 
 
@@ -528,7 +649,7 @@ class PostProcessingGui(QObject, Extension):
         # Iterate over each layer in the gcode
         for layer_number, elapsed_time in self._enumerateLayerElapsedTime(gcode):
 
-            if layer_number in active_scripts_data.keys():
+            if layer_number in active_scripts_data:
 
                 # Calculate elapsed times
                 section_elapsed_time = elapsed_time - layer_start_time
@@ -629,11 +750,39 @@ class PostProcessingGui(QObject, Extension):
 
 
 
-    def _removeScript(self, script_index:int)->None:
+    def _getScriptKey(self, script)->str:
+        ''' Return the key of a post-processing script
+            Script.getSettingData parses the script's JSON every time it's
+            called, so the key is only looked up once per script class '''
+
+        script_class = type(script)
+        try:
+            script_key = self._script_key_by_class[script_class]
+        except KeyError:
+            script_key = script.getSettingData()['key']
+            self._script_key_by_class[script_class] = script_key
+        return script_key
+
+
+
+    def _removeScript(self, script_index:int, script_key:str, layer_number:int)->None:
         ''' Remove a script from the list of active post-processing scripts 
-            in the PostProcessingPlugin '''
+            in the PostProcessingPlugin
+            The script key and layer number are those shown on the button that
+            was clicked and are used to confirm the index still refers to the
+            same script '''
+
+        script_list = self._postProcessingPlugin._script_list
+
+        # The GUI may not have caught up with recent changes to the script
+        # list, so make sure the script at this index is the one that was
+        # clicked before removing anything
+        if not 0 <= script_index < len(script_list) or not self._scriptMatches(script_list[script_index], script_key, layer_number):
+            Logger.log('w', f'Not removing post-processing script {script_index} because it is no longer "{script_key}" at layer {layer_number}')
+            return
+
+        script_list.pop(script_index)
 
-        self._postProcessingPlugin._script_list.pop(script_index)
         if len(self._postProcessingPlugin._script_list) - 1 < self._postProcessingPlugin._selected_script_index:
             self._postProcessingPlugin._selected_script_index = len(self._postProcessingPlugin._script_list) - 1
         self._postProcessingPlugin.scriptListChanged.emit()
@@ -643,6 +792,26 @@ class PostProcessingGui(QObject, Extension):
 
 
 
+    def _scriptMatches(self, script, script_key:str, layer_number:int)->bool:
+        ''' Determine if a post-processing script has the given key and acts on
+            the given layer number '''
+
+        if self._getScriptKey(script) != script_key:
+            return False
+
+        # Check the layer number setting of each matching supported script
+        for script_data in self._script_table_by_key.get(script_key, []):
+            try:
+                if int(script.getSettingValueByKey(script_data['layer_number_setting'])) == layer_number:
+                    return True
+            except (TypeError, ValueError):
+                # The layer number can't be interpreted as an integer
+                continue
+
+        return False
+
+
+
     def _loadPluginSettings(self)->None:
         ''' Restore this plugin's settings '''
 
@@ -653,16 +822,16 @@ class PostProcessingGui(QObject, Extension):
             selected_script_key = self._global_container_stack.getMetaDataEntry(self._metaDataId)
 
             # Find the index of the script with the matching key
-            selected_script_index = 0
-            for index in range(0, len(self._script_table)):
-                script_data = self._script_table[index]
-                script_key = script_data['script_key']
-                if script_key == selected_script_key:
-                    selected_script_index = index
-                    break
+            selected_script_index = self._script_index_by_key.get(selected_script_key, 0)
 
             # Update the selected script index
-            self.setSelectedScriptIndex(selected_script_index)
+            # Creating the temporary script is relatively expensive, so it's
+            # only recreated if the selection has actually changed or the
+            # script's class has been reloaded (this is called on every global
+            # container stack change)
+            script_class = self._script_table[selected_script_index]['script_class']
+            if selected_script_index != self._selected_script_index or type(self._tempScript) is not script_class:
+                self.setSelectedScriptIndex(selected_script_index)
 
         else:
             Logger.log('e', 'Unable to restore plugin settings because there is no global container stack')
@@ -675,23 +844,27 @@ class PostProcessingGui(QObject, Extension):
 
         self._script_table:List[Dict] = []
 
-        # Retrieve the names of all .json files included with the plugin
-        json_dir = os.path.join(self._pluginDir, 'Resources', 'Json')
-        json_wildcard = os.path.join(json_dir, '*.json')
-        json_file_paths = glob(json_wildcard)
+        # Forget the keys of previously-loaded script classes, which are
+        # cached again as the table is rebuilt
+        self._script_key_by_class = {}
 
-        # Iterate over each available JSON file
-        for json_file_path in json_file_paths:
+        # Retrieve the paths and names of all .json files included with the
+        # plugin in a single pass over the directory
+        with os.scandir(self._jsonDir) as dir_entries:
+            json_files = [(entry.path, entry.name) for entry in dir_entries if entry.name.endswith('.json') and entry.is_file()]
+
+        # The scripts currently loaded by the post-processing plugin
+        loaded_scripts = self._postProcessingPlugin._loaded_scripts
 
-            # Grab just the file name of this jsob file
-            json_file_name = os.path.basename(json_file_path)
+        # Iterate over each available JSON file
+        for json_file_path, json_file_name in json_files:
 
             # Open the json file
-            with open(json_file_path, 'r') as json_file:
+            with open(json_file_path, 'rb') as json_file:
 
                 try:
                     # Read in the contents as a dictionary
-                    json_dict = json.load(json_file, object_pairs_hook=collections.OrderedDict)
+                    json_dict = json.loads(json_file.read())
 
                     # Determine the key of the corresponding post-processing script
                     json_script_key = json_dict['script_key']
@@ -699,7 +872,7 @@ class PostProcessingGui(QObject, Extension):
                     # Look up the matching post-processing script
                     try:
                         # Determine the matching post-processing script class
-                        script_class = self._postProcessingPlugin._loaded_scripts[json_script_key]
+                        script_class = loaded_scripts[json_script_key]
                         json_dict['script_class'] = script_class
                     except KeyError:
                         Logger.log('w', f'The script key "{json_script_key}" in "{json_file_name}" does not match any available post-processing scripts')
@@ -708,8 +881,13 @@ class PostProcessingGui(QObject, Extension):
                     try:
                         # Use a temporary instantation to grab script information
                         temp_script = script_class()
-                        script_name = temp_script.getSettingData()['name']
+                        setting_data = temp_script.getSettingData()
+                        script_name = setting_data['name']
                         json_dict['script_name'] = script_name
+
+                        # The setting data has already been parsed, so
+                        # remember the script key for this class as well
+                        self._script_key_by_class[script_class] = setting_data['key']
                     except KeyError:
                         continue
 
@@ -724,3 +902,15 @@ class PostProcessingGui(QObject, Extension):
 
         # Sort the script table by name
         self._script_table = sorted(self._script_table, key=lambda x: x['script_name'])
+
+        # Index the script table by script key so active scripts can be 
+        # matched without scanning the whole table
+        self._script_table_by_key = {}
+        self._script_index_by_key = {}
+        for index, script_data in enumerate(self._script_table):
+            self._script_table_by_key.setdefault(script_data['script_key'], []).append(script_data)
+            self._script_index_by_key.setdefault(script_data['script_key'], index)
+
+        # Build the available scripts model once rather than on every read
+        self._available_scripts_model = [{'script_name': script_data['script_name']} for script_data in self._script_table]
+        self._available_scripts_model_changed.emit()
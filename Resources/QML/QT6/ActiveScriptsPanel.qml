@@ -48,7 +48,7 @@ RowLayout
                     }
                     else if (mouse.button == Qt.MiddleButton)
                     {
-                        manager.onActiveScriptButtonCenterClicked(modelData['script_index'])
+                        manager.onActiveScriptButtonCenterClicked(modelData['script_index'], modelData['script_key'], modelData['layer_number'])
                     }
                     else
                     {
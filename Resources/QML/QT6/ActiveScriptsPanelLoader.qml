@@ -0,0 +1,19 @@
+// Copyright (c) 2024 Brad Kartchner
+// Released under the terms of the LGPLv3 or higher.
+
+import QtQuick 6.0
+
+// This lightweight component stands in for the active scripts panel so the
+// panel itself is only parsed and instantiated the first time it is shown
+// Once created, the panel is kept for the rest of the session
+Loader
+{
+    active: false
+    asynchronous: true
+    source: 'ActiveScriptsPanel.qml'
+
+    // The loader is reparented into Cura's save button area, which stays
+    // hidden until a slice has finished
+    onVisibleChanged: if (visible) active = true
+    onParentChanged: if (parent && visible) active = true
+}